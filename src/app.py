@@ -2,7 +2,7 @@ import geopandas as gpd
 import dash_leaflet as dl
 import dash
 from dash import dcc, html, dash_table
-from dash.dependencies import Input, Output, State
+from dash.dependencies import Input, Output, State, ClientsideFunction
 import dash_daq as daq
 import plotly.express as px
 import pandas as pd
@@ -13,6 +13,7 @@ from dash.exceptions import PreventUpdate
 import os
 import dash_bootstrap_components as dbc
 from datetime import datetime
+from functools import cached_property
 import numpy as np
 from dash import callback_context
 
@@ -21,23 +22,76 @@ app = dash.Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP, 'https://f
 
 # Load and preprocess the updated data
 file_path = './src/data/updated_mobility_data.csv'
-combined_data = pd.read_csv(file_path)
+# Only the columns the dashboard uses are read, with compact dtypes for coordinates and counts
+combined_data = pd.read_csv(
+    file_path,
+    usecols=['Day', 'Hours', 'Source Category', 'Destination Category', 'y0_shifted', 'x0_shifted', 'y1_shifted', 'x1_shifted', 'Daily Baseline: People Moving', 'Crisis: People Moving'],
+    dtype={'y0_shifted': 'float32', 'x0_shifted': 'float32', 'y1_shifted': 'float32', 'x1_shifted': 'float32', 'Daily Baseline: People Moving': 'int32', 'Crisis: People Moving': 'int32'}
+)
 
 # Convert 'Day' and 'Hours' to datetime and create a new column for filtering
-combined_data['DateTime'] = pd.to_datetime(combined_data['Day'] + ' ' + combined_data['Hours'], format='%B %d, %Y %H:%M')
-
-# Format the slider labels
-def format_datetime_label(dt):
-    if f"{dt.strftime('%H:%M')}" == "00:00":
-        return f"{dt.strftime('%d %b')} (1)"
-    elif f"{dt.strftime('%H:%M')}" == "08:00":
-        return f"{dt.strftime('%d %b')} (2)"
-    else:
-        return f"{dt.strftime('%d %b')} (3)"
+# Only the few distinct day and hour strings are parsed, then mapped back to every row through the category codes
+day_categories = combined_data['Day'].astype('category')
+hour_categories = combined_data['Hours'].astype('category')
+days = pd.to_datetime(day_categories.cat.categories, format='%B %d, %Y')
+hours = pd.to_timedelta(hour_categories.cat.categories + ':00')
+combined_data['DateTime'] = days.take(day_categories.cat.codes) + hours.take(hour_categories.cat.codes)
+combined_data['Source Category'] = combined_data['Source Category'].astype('category')
+combined_data['Destination Category'] = combined_data['Destination Category'].astype('category')
 
 # Ensure the slider marks are ordered by date
 sorted_datetimes = combined_data['DateTime'].sort_values().unique()
-slider_marks = {i: {'label': format_datetime_label(date), 'style': {'font-size': '10px', 'max-width': '45px', 'text-align': 'center', 'white-space': 'nowrap'}} for i, date in enumerate(sorted_datetimes)}
+
+# Position of each row's datetime on the slider, so lookups can use the slider value directly
+combined_data['dt_idx'] = np.searchsorted(sorted_datetimes, combined_data['DateTime'].to_numpy()).astype('int32')
+
+# Format the slider labels as the day plus the part of it: (1) from 00:00, (2) from 08:00, (3) otherwise
+slider_datetimes = pd.DatetimeIndex(sorted_datetimes)
+hours_minutes = slider_datetimes.strftime('%H:%M').to_numpy(dtype=str)
+day_parts = np.where(hours_minutes == '00:00', ' (1)', np.where(hours_minutes == '08:00', ' (2)', ' (3)'))
+slider_labels = np.char.add(slider_datetimes.strftime('%d %b').to_numpy(dtype=str), day_parts).tolist()
+slider_mark_style = {'font-size': '10px', 'max-width': '45px', 'text-align': 'center', 'white-space': 'nowrap'}
+slider_marks = {i: {'label': label, 'style': slider_mark_style} for i, label in enumerate(slider_labels)}
+
+# Each route column is kept as its own NumPy array so the counts keep their original dtype
+route_columns = ['y0_shifted', 'x0_shifted', 'y1_shifted', 'x1_shifted', 'Daily Baseline: People Moving', 'Crisis: People Moving']
+key_columns = ['dt_idx', 'Source Category', 'Destination Category']
+
+# Ship the pre-grouped routes to the browser once, keyed by "slider index|source|destination", so the map is redrawn clientside
+# Coordinates are rounded to 5 decimals (about 1 m) to keep the store payload small
+def route_payload(y0, x0, y1, x1, baseline, crisis):
+    return {
+        'y0': y0.astype('float64').round(5).tolist(),
+        'x0': x0.astype('float64').round(5).tolist(),
+        'y1': y1.astype('float64').round(5).tolist(),
+        'x1': x1.astype('float64').round(5).tolist(),
+        'baseline': baseline.tolist(),
+        'crisis': crisis.tolist()
+    }
+
+# The route groups and the encoded store are built on first use (the first page load) rather than at import,
+# so starting the app, which the debug reloader does twice, skips them
+class Precompute:
+    @cached_property
+    def grouped(self):
+        # Sort a copy once by the key columns so every group is a contiguous slice, found with searchsorted on a combined key code
+        sorted_routes = combined_data.sort_values(key_columns)
+        source_count = len(sorted_routes['Source Category'].cat.categories)
+        destination_count = len(sorted_routes['Destination Category'].cat.categories)
+        key_codes = (sorted_routes['dt_idx'].to_numpy(dtype='int64') * source_count + sorted_routes['Source Category'].cat.codes.to_numpy()) * destination_count + sorted_routes['Destination Category'].cat.codes.to_numpy()
+        unique_codes, starts = np.unique(key_codes, return_index=True)
+        ends = np.searchsorted(key_codes, unique_codes, side='right')
+        route_arrays = [sorted_routes[col].to_numpy() for col in route_columns]
+        keys = sorted_routes[key_columns].iloc[starts].itertuples(index=False, name=None)
+        return {key: tuple(array[start:end] for array in route_arrays) for key, start, end in zip(keys, starts, ends)}
+
+    @cached_property
+    def routes_store_json(self):
+        # Encode the store once so each page load sends a ready-made string instead of re-walking the nested dicts
+        routes_store = {f"{index}|{source}|{destination}": route_payload(*columns) for (index, source, destination), columns in self.grouped.items()}
+        return json.dumps(routes_store, separators=(',', ':'))
+
+precomputed = Precompute()
 
 # Learn More content
 content = html.Div([
@@ -123,8 +177,20 @@ app.layout = html.Div(
         ]),
         dl.Map([
             dl.TileLayer(),
-            dl.LayerGroup(id="route-layer")
-        ], style={'width': '100%', 'height': '700px'}, center=[20.5937, 78.9629], zoom=8),
+            # Persistent layer whose data is swapped by the map callback; styles and tooltip labels live in the hideout
+            dl.GeoJSON(
+                id="route-layer",
+                pointToLayer=dict(variable='mobility.pointToLayer'),
+                style=dict(variable='mobility.style'),
+                onEachFeature=dict(variable='mobility.onEachFeature'),
+                hideout=dict(
+                    route=dict(style=dict(color='blue', weight=1)),
+                    origin=dict(label='Baseline', style=dict(radius=4, color='green', weight=1, fillOpacity=0.8)),
+                    destination=dict(label='Crisis', style=dict(radius=4, color='red', weight=1, fillOpacity=0.8))
+                )
+            )
+        ], preferCanvas=True, style={'width': '100%', 'height': '700px'}, center=[20.5937, 78.9629], zoom=8),
+        dcc.Store(id='routes-store'),
         html.Div(style={'margin-top': '20px'}),  # Add space between the map and slider
         dcc.Slider(
             id='datetime-slider',
@@ -132,43 +198,31 @@ app.layout = html.Div(
             max=len(sorted_datetimes)-1,
             value=0,
             marks=slider_marks,
-            step=None
+            step=None,
+            updatemode='mouseup'  # Redraw the map once on release rather than for every mark passed while dragging
         )
     ]
 )
 
-# Update map layers based on datetime, source, and destination categories
-@app.callback(
-    Output("route-layer", "children"),
+# Update map layers based on datetime, source, and destination categories (see assets/map.js)
+app.clientside_callback(
+    ClientsideFunction(namespace='maps', function_name='update'),
+    Output("route-layer", "data"),
     [
         Input("datetime-slider", "value"),
         Input("source-category-dropdown", "value"),
-        Input("destination-category-dropdown", "value")
+        Input("destination-category-dropdown", "value"),
+        Input("routes-store", "data")
     ]
 )
-def update_map(datetime_index, source_category, destination_category):
-    selected_datetime = sorted_datetimes[datetime_index]
-    filtered_data = combined_data[(combined_data['DateTime'] == selected_datetime) & 
-                                  (combined_data['Source Category'] == source_category) &
-                                  (combined_data['Destination Category'] == destination_category)]
-
-    routes = []
-    for _, row in filtered_data.iterrows():
-        origin = [row['y0_shifted'], row['x0_shifted']]
-        destination = [row['y1_shifted'], row['x1_shifted']]
-        tooltip_origin = f"Baseline: {row['Daily Baseline: People Moving']}"
-        tooltip_destination = f"Crisis: {row['Crisis: People Moving']}"
-
-        # Create markers with custom icons
-        origin_marker = dl.Marker(position=origin, icon=dict(iconUrl='https://raw.githubusercontent.com/pointhi/leaflet-color-markers/master/img/marker-icon-2x-green.png', iconSize=[8, 14]), children=dl.Tooltip(tooltip_origin))
-        destination_marker = dl.Marker(position=destination, icon=dict(iconUrl='https://raw.githubusercontent.com/pointhi/leaflet-color-markers/master/img/marker-icon-2x-red.png', iconSize=[8, 14]), children=dl.Tooltip(tooltip_destination))
 
-        # Create a polyline for the route
-        route_line = dl.Polyline(positions=[origin, destination], color='blue', weight=1)
-
-        routes.extend([origin_marker, destination_marker, route_line])
-
-    return routes
+# Send the precomputed routes to the browser on page load
+@app.callback(
+    Output("routes-store", "data"),
+    [Input("routes-store", "id")]
+)
+def load_routes(_):
+    return precomputed.routes_store_json
 
 # Control the visibility of the "Learn More" button
 @app.callback(
@@ -0,0 +1,76 @@
+// Leaflet callbacks referenced from app.py as {'variable': 'mobility.<name>'}
+// Each feature's properties.kind ('route', 'origin' or 'destination') selects its entry in the layer's hideout
+window.mobility = Object.assign({}, window.mobility, {
+    // Draw GeoJSON points as circle markers so they share the map's canvas renderer
+    pointToLayer: function(feature, latlng, context) {
+        return L.circleMarker(latlng, context.hideout[feature.properties.kind].style);
+    },
+    style: function(feature, context) {
+        return context.hideout[feature.properties.kind].style;
+    },
+    // Format point tooltips from the raw count carried by each feature
+    onEachFeature: function(feature, layer, context) {
+        const kind = context.hideout[feature.properties.kind];
+        if (kind.label) {
+            layer.bindTooltip(kind.label + ': ' + feature.properties.value);
+        }
+    }
+});
+
+const EMPTY_ROUTES = {type: 'FeatureCollection', features: []};
+
+// The routes store arrives as a JSON string; parse it once and reuse the result while the string is unchanged
+let storeSource = null;
+let storeRoutes = null;
+function parseStore(store) {
+    if (store !== storeSource) {
+        storeSource = store;
+        storeRoutes = JSON.parse(store);
+    }
+    return storeRoutes;
+}
+
+// Feature collections already built for a store key, evicted least recently used first
+const ROUTE_CACHE_SIZE = 512;
+const routeCache = new Map();
+
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    maps: {
+        // Rebuild the route features for the selected datetime and categories from the routes store
+        update: function(datetimeIndex, sourceCategory, destinationCategory, store) {
+            // The store is empty until the routes arrive from the server on page load
+            if (!store) {
+                return EMPTY_ROUTES;
+            }
+            const key = [datetimeIndex, sourceCategory, destinationCategory].join('|');
+            const routes = parseStore(store)[key];
+            if (!routes) {
+                return EMPTY_ROUTES;
+            }
+            if (routeCache.has(key)) {
+                const cached = routeCache.get(key);
+                routeCache.delete(key);
+                routeCache.set(key, cached);
+                return cached;
+            }
+
+            const origins = [];
+            const destinations = [];
+            const segments = [];
+            for (let i = 0; i < routes.y0.length; i++) {
+                origins.push({type: 'Feature', geometry: {type: 'Point', coordinates: [routes.x0[i], routes.y0[i]]}, properties: {kind: 'origin', value: routes.baseline[i]}});
+                destinations.push({type: 'Feature', geometry: {type: 'Point', coordinates: [routes.x1[i], routes.y1[i]]}, properties: {kind: 'destination', value: routes.crisis[i]}});
+                segments.push([[routes.x0[i], routes.y0[i]], [routes.x1[i], routes.y1[i]]]);
+            }
+
+            // Every route as one multi-line feature, with origins and destinations drawn on top
+            const route = {type: 'Feature', geometry: {type: 'MultiLineString', coordinates: segments}, properties: {kind: 'route'}};
+            const features = {type: 'FeatureCollection', features: [route].concat(origins, destinations)};
+            routeCache.set(key, features);
+            if (routeCache.size > ROUTE_CACHE_SIZE) {
+                routeCache.delete(routeCache.keys().next().value);
+            }
+            return features;
+        }
+    }
+});